@@ -1,5 +1,12 @@
-from config.db_setup import db_config
-from config.kaggle_setup import kaggle_key
-from config.logging_setup import LoggerSetup
+import logging
 
-__all__ = ["kaggle_key", "db_config", "LoggerSetup"]
+# Configure logging before the setup modules below log anything
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+
+from config.db_setup import db_config, DB_URL  # noqa: E402
+from config.kaggle_setup import kaggle_key  # noqa: E402
+from config.logging_setup import LoggerSetup  # noqa: E402
+
+__all__ = ["kaggle_key", "db_config", "DB_URL", "LoggerSetup"]
@@ -0,0 +1,72 @@
+import json
+import os
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
+from dotenv import dotenv_values, find_dotenv
+from dotenv.main import resolve_variables
+
+CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "loaneligibility", "env.json"
+)
+
+
+def _read_dotenv(path: str) -> Dict[str, Optional[str]]:
+    """
+    Returns the raw, uninterpolated variables defined in the .env file, reusing
+    the cached parse from a previous run while the file's modification time and
+    size are unchanged.
+
+    Args:
+        path (str): Path of the .env file.
+
+    Returns:
+        Dict[str, Optional[str]]: The variables defined in the .env file, in order.
+    """
+    stat = os.stat(path)
+    key = [os.path.abspath(path), stat.st_mtime_ns, stat.st_size]
+
+    try:
+        with open(CACHE_PATH, encoding="utf-8") as cache_file:
+            cached = json.load(cache_file)
+        if cached["key"] == key:
+            os.chmod(CACHE_PATH, 0o600)
+            return cached["values"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    values = dict(dotenv_values(path, interpolate=False))
+    try:
+        os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+        descriptor = os.open(
+            CACHE_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600
+        )
+        # The mode above only applies to new files; the cache holds credentials,
+        # so also restrict a cache file that already existed.
+        os.chmod(CACHE_PATH, 0o600)
+        with open(descriptor, "w", encoding="utf-8") as cache_file:
+            json.dump({"key": key, "values": values}, cache_file)
+    except OSError:
+        pass
+    return values
+
+
+@lru_cache(maxsize=1)
+def load_env() -> Mapping[str, str]:
+    """
+    Loads the .env file once per process and returns a read-only snapshot of the
+    resulting environment variables. Behaves like load_dotenv: ${VAR} references
+    are resolved on every run with the process environment taking precedence,
+    and variables already set in the environment are not overridden.
+
+    Returns:
+        Mapping[str, str]: The environment variables after loading the .env file.
+    """
+    path = find_dotenv()
+    if path:
+        raw_values = _read_dotenv(path)
+        resolved = resolve_variables(raw_values.items(), override=False)
+        for name, value in resolved.items():
+            if value is not None:
+                os.environ.setdefault(name, value)
+    return MappingProxyType(dict(os.environ))
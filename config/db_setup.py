@@ -1,13 +1,32 @@
-import os
-from dotenv import load_dotenv
+import logging
+from config._env import load_env
 
 # Load environment variables from .env file
-load_dotenv()
+env = load_env()
 
 db_config = {
-    "host": os.getenv("LOANS_DB_HOST"),
-    "port": os.getenv("LOANS_DB_PORT"),
-    "database": os.getenv("LOANS_DB_NAME"),
-    "user": os.getenv("LOANS_DB_USER"),
-    "password": os.getenv("LOANS_DB_PASSWORD"),
+    "host": env.get("LOANS_DB_HOST"),
+    "port": env.get("LOANS_DB_PORT"),
+    "database": env.get("LOANS_DB_NAME"),
+    "user": env.get("LOANS_DB_USER"),
+    "password": env.get("LOANS_DB_PASSWORD"),
 }
+
+missing_keys = [key for key, value in db_config.items() if not value]
+if missing_keys:
+    message = (
+        "Database configuration is missing values for: "
+        f"{', '.join(missing_keys)}"
+    )
+    logging.error(message)
+    raise EnvironmentError(message)
+
+# Build the connection URL once so connections do not rebuild it
+DB_URL = (
+    f"postgresql+asyncpg://"
+    f"{db_config['user']}:"
+    f"{db_config['password']}"
+    f"@{db_config['host']}:"
+    f"{db_config['port']}/"
+    f"{db_config['database']}"
+)
@@ -1,18 +1,12 @@
-import os
 import logging
-from dotenv import load_dotenv
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
-)
+from config._env import load_env
 
 # Load environment variables from .env file
-load_dotenv()
+env = load_env()
 
 # Access the Kaggle API key
-kaggle_username = os.getenv("KAGGLE_USERNAME")
-kaggle_key = os.getenv("KAGGLE_KEY")
+kaggle_username = env.get("KAGGLE_USERNAME")
+kaggle_key = env.get("KAGGLE_KEY")
 
 if not kaggle_username or not kaggle_key:
     logging.error("Kaggle API credentials are not set properly.")
@@ -31,7 +31,13 @@ class LoggerSetup:
         self.setup_logging()
 
     def setup_logging(self):
-        """Configures logging to use a rotating file handler."""
+        """
+        Configures logging to use a rotating file handler. Loggers that already
+        have a handler are left untouched, so repeated setups do not duplicate output.
+        """
+        if self.logger.handlers:
+            return
+
         os.makedirs(self.full_log_path, exist_ok=True)
 
         log_formatter = logging.Formatter(
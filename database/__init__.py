@@ -1,3 +1,7 @@
-from .connection_sqlalchemy import AsyncSQLAlchemyConnection
+from .connection_sqlalchemy import (
+    AsyncSQLAlchemyConnection,
+    POOL_SIZE,
+    dispose_engine,
+)
 
-__all__ = ["AsyncSQLAlchemyConnection"]
+__all__ = ["AsyncSQLAlchemyConnection", "POOL_SIZE", "dispose_engine"]
@@ -1,9 +1,84 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator, Dict
+from typing import AsyncGenerator, Optional, Tuple
 from config import LoggerSetup
-from config import db_config as config
+from config import DB_URL
+
+POOL_SIZE = 25
+MAX_OVERFLOW = 0
+POOL_TIMEOUT = 30
+POOL_RECYCLE = 1800
+STATEMENT_CACHE_SIZE = 256
+
+logger = LoggerSetup(logger_name="AsyncSQLAlchemyConnection").logger
+
+
+_engine: Optional[AsyncEngine] = None
+_engine_settings: Optional[Tuple[str, int, int, int, int]] = None
+
+
+def get_engine(
+    db_url: str,
+    pool_size: int = POOL_SIZE,
+    max_overflow: int = MAX_OVERFLOW,
+    pool_timeout: int = POOL_TIMEOUT,
+    pool_recycle: int = POOL_RECYCLE,
+) -> AsyncEngine:
+    """
+    Returns the process-wide asynchronous engine, creating it on first use so that
+    all connections are drawn from a single pool. Each pooled connection keeps
+    prepared statements cached, so repeated queries skip the parse and plan step.
+
+    :param db_url: SQLAlchemy database URL.
+    :param pool_size: Number of connections kept open in the pool.
+    :param max_overflow: Number of connections allowed beyond pool_size.
+    :param pool_timeout: Seconds to wait for a free connection before failing.
+    :param pool_recycle: Seconds after which a pooled connection is replaced.
+    :raises ValueError: If the engine already exists with different settings.
+    :return: The shared asynchronous SQLAlchemy engine.
+    """
+    global _engine, _engine_settings
+    settings = (db_url, pool_size, max_overflow, pool_timeout, pool_recycle)
+    if _engine is not None:
+        if settings != _engine_settings:
+            raise ValueError(
+                "The database engine already exists with different settings; "
+                "call dispose_engine() before reconfiguring it."
+            )
+        return _engine
+
+    _engine = create_async_engine(
+        db_url,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=pool_timeout,
+        pool_recycle=pool_recycle,
+        pool_pre_ping=True,
+        connect_args={
+            "statement_cache_size": STATEMENT_CACHE_SIZE,
+            "prepared_statement_cache_size": STATEMENT_CACHE_SIZE,
+        },
+    )
+    _engine_settings = settings
+    return _engine
+
+
+async def dispose_engine() -> None:
+    """
+    Closes all pooled connections of the shared engine, if one has been created.
+    Intended to be called once at application shutdown; the next connection
+    creates a fresh engine.
+    """
+    global _engine, _engine_settings
+    if _engine is None:
+        return
+    engine, _engine, _engine_settings = _engine, None, None
+    await engine.dispose()
 
 
 class AsyncSQLAlchemyConnection:
@@ -12,41 +87,38 @@ class AsyncSQLAlchemyConnection:
     are properly opened and closed, and transactions are correctly managed with commits or rollbacks as needed.
     """
 
-    def __init__(self, db_config: Dict[str, str] = config):
+    def __init__(
+        self,
+        db_url: str = DB_URL,
+        pool_size: int = POOL_SIZE,
+        max_overflow: int = MAX_OVERFLOW,
+        pool_timeout: int = POOL_TIMEOUT,
+        pool_recycle: int = POOL_RECYCLE,
+    ):
         """
-        Initializes the AsyncSQLAlchemyConnection with the provided database configuration.
+        Initializes the AsyncSQLAlchemyConnection with the provided database URL.
 
-        :param db_config: Dictionary containing database configuration parameters.
+        :param db_url: SQLAlchemy database URL, validated when config is imported.
+        :param pool_size: Number of connections kept open in the pool.
+        :param max_overflow: Number of connections allowed beyond pool_size.
+        :param pool_timeout: Seconds to wait for a free connection before failing.
+        :param pool_recycle: Seconds after which a pooled connection is replaced.
         """
         self._setup_logger()
-        self._validate_config(db_config)
-        db_url = (
-            f"postgresql+asyncpg://"
-            f"{db_config['user']}:"
-            f"{db_config['password']}"
-            f"@{db_config['host']}:"
-            f"{db_config['port']}/"
-            f"{db_config['database']}"
+        self.engine = get_engine(
+            db_url,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+            pool_recycle=pool_recycle,
         )
-        self.engine = create_async_engine(db_url)
-        self.AsyncSession = sessionmaker(
-            bind=self.engine, expire_on_commit=False, class_=AsyncSession
+        self.async_session = async_sessionmaker(
+            self.engine, expire_on_commit=False
         )
 
     def _setup_logger(self):
         """Sets up the logger for database operations."""
-        self.logger = LoggerSetup(
-            logger_name="AsyncSQLAlchemyConnection"
-        ).logger
-
-    @staticmethod
-    def _validate_config(db_config: Dict[str, str]) -> None:
-        required_keys = ["user", "password", "host", "port", "database"]
-        for key in required_keys:
-            if key not in db_config:
-                raise ValueError(
-                    f"Missing required database configuration key: {key}"
-                )
+        self.logger = logger
 
     @asynccontextmanager
     async def connect(self) -> AsyncGenerator[AsyncSession, None]:
@@ -56,7 +128,7 @@ class AsyncSQLAlchemyConnection:
 
         :yield: An asynchronous SQLAlchemy session.
         """
-        async with self.AsyncSession() as session:
+        async with self.async_session() as session:
             try:
                 yield session
                 await session.commit()
@@ -1,10 +1,11 @@
 import asyncio
-from typing import Dict
-import pandas as pd
-from src.get_dataset import main as get_dataset_main
-from src.push_dataset import push_dataset
+import sys
+from typing import TYPE_CHECKING, Dict
 from config import LoggerSetup
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 def setup_logger() -> LoggerSetup:
     """
@@ -22,13 +23,20 @@ async def main() -> None:
 
     It downloads the dataset, loads it into DataFrames, and then sets up the
     database using the downloaded dataset.
+
+    The pandas, aiohttp and SQLAlchemy stacks are imported here rather than at
+    module level so that importing this script stays cheap.
     """
+    from src.get_dataset import main as get_dataset_main
+    from src.push_dataset import push_dataset
+    from database import dispose_engine
+
     logger = setup_logger().logger
     dataset_name = "vikasukani/loan-eligible-dataset"
 
     try:
         logger.info("Starting dataset download...")
-        dataframes: Dict[str, pd.DataFrame] = await get_dataset_main(
+        dataframes: Dict[str, "pd.DataFrame"] = await get_dataset_main(
             dataset_name
         )
         logger.info("Dataset downloaded and loaded into DataFrames.")
@@ -40,6 +48,25 @@ async def main() -> None:
     except Exception as e:
         logger.error(f"An error occurred: {e}", exc_info=True)
 
+    finally:
+        await dispose_engine()
 
-if __name__ == "__main__":
+
+def run() -> None:
+    """
+    Runs the main coroutine on uvloop where it is available, falling back to the
+    default asyncio event loop on Windows or when uvloop is not installed.
+    """
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            uvloop.run(main())
+            return
     asyncio.run(main())
+
+
+if __name__ == "__main__":
+    run()
@@ -1,22 +1,75 @@
 import aiohttp
 import asyncio
+import multiprocessing
+import os
 import pandas as pd
-from aiohttp import ClientError
-from zipfile import ZipFile
+import random
+import tempfile
+from aiohttp import ClientError, ClientResponseError
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from zipfile import ZipFile, ZipInfo
 from io import BytesIO
-from typing import Dict, List, Optional
+from typing import (
+    BinaryIO,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 from config import kaggle_key, LoggerSetup
 
+CHUNK_SIZE = 1 << 20
+SPOOL_MAX_SIZE = 64 * 1024 * 1024
+PARSE_IN_PROCESS_MIN_SIZE = 4 * 1024 * 1024
+
+logger = LoggerSetup(logger_name="DatasetDownloader").logger
+dataframe_logger = LoggerSetup(logger_name="DataFrameLoader").logger
+
+
+def _parse(
+    file_name: str, file_data: Union[bytes, BinaryIO]
+) -> Tuple[str, pd.DataFrame]:
+    """
+    Parses a single CSV or Excel file into a DataFrame. Defined at module level so
+    it can be sent to a process pool.
+
+    Args:
+        file_name (str): The name of the file, used to pick the parser.
+        file_data (Union[bytes, BinaryIO]): The file content, or a stream over it.
+
+    Raises:
+        ValueError: If the file extension is not supported.
+
+    Returns:
+        Tuple[str, pd.DataFrame]: The filename and its DataFrame.
+    """
+    source = BytesIO(file_data) if isinstance(file_data, bytes) else file_data
+    if file_name.endswith(".xlsx"):
+        df = pd.read_excel(source, engine="calamine", dtype_backend="pyarrow")
+    elif file_name.endswith(".csv"):
+        df = pd.read_csv(source, engine="pyarrow", dtype_backend="pyarrow")
+    else:
+        raise ValueError(f"Unsupported file type: {file_name}")
+    return file_name, df
+
 
 class DatasetDownloader:
     """
     Manages downloading datasets from Kaggle using asynchronous requests and handling the response.
 
+    Use it as an asynchronous context manager so that a single HTTP session, and its
+    pooled connections, is reused for every request made by the downloader.
+
     Attributes:
         dataset (str): The name of the dataset to download.
         retries (int): The number of retries if the download fails.
-        delay (int): The delay between retries.
+        delay (int): The base delay between retries, doubled after each failed attempt.
+        max_delay (int): The upper bound for the backoff delay between retries.
         file_extensions (List[str]): List of file extensions to extract from the downloaded ZIP.
+        max_connections (int): Maximum number of concurrent TCP connections, 0 for no limit.
         headers (Dict[str, str]): HTTP headers for the Kaggle API request.
         logger (logging.Logger): Logger instance for logging messages.
     """
@@ -26,7 +79,9 @@ class DatasetDownloader:
         dataset: str,
         retries: int = 3,
         delay: int = 5,
+        max_delay: int = 60,
         file_extensions: Optional[List[str]] = None,
+        max_connections: int = 0,
     ):
         """
         Initializes the DatasetDownloader with the given parameters.
@@ -34,12 +89,17 @@ class DatasetDownloader:
         Args:
             dataset (str): The name of the dataset to download.
             retries (int, optional): Number of retries on failure. Defaults to 3.
-            delay (int, optional): Delay between retries in seconds. Defaults to 5.
+            delay (int, optional): Base delay between retries in seconds. Defaults to 5.
+            max_delay (int, optional): Upper bound for the backoff delay in seconds. Defaults to 60.
             file_extensions (Optional[List[str]], optional): List of file extensions to extract. Defaults to None.
+            max_connections (int, optional): Maximum number of concurrent TCP connections, in total
+                and per host. 0 removes aiohttp's default cap of 100 so parallel downloads do not
+                queue in the connector; set a limit if Kaggle starts throttling. Defaults to 0.
         """
         self.dataset = dataset
         self.retries = retries
         self.delay = delay
+        self.max_delay = max_delay
         self.kaggle_api = (
             f"https://www.kaggle.com/api/v1/datasets/download/{self.dataset}"
         )
@@ -48,36 +108,97 @@ class DatasetDownloader:
             "Authorization": f"Bearer {kaggle_key}",
         }
         self.file_extensions = file_extensions or [".xlsx", ".csv"]
-        self.logger = LoggerSetup(logger_name="DatasetDownloader").logger
+        self.max_connections = max_connections
+        self.logger = logger
+        self._session: Optional[aiohttp.ClientSession] = None
 
         if not kaggle_key:
             raise ValueError(
                 "Kaggle API key not found. Ensure it is set in the environment variables."
             )
 
-    async def fetch_dataset(self, session: aiohttp.ClientSession) -> bytes:
+    async def __aenter__(self) -> "DatasetDownloader":
         """
-        Fetches the dataset from Kaggle using the provided session.
+        Opens the HTTP session shared by all requests of this downloader.
+
+        Returns:
+            DatasetDownloader: The downloader itself.
+        """
+        self._session = aiohttp.ClientSession(
+            headers=self.headers,
+            connector=aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.max_connections,
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+                enable_cleanup_closed=True,
+            ),
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Closes the shared HTTP session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _retry_delay(self, attempt: int, error: ClientError) -> float:
+        """
+        Computes how long to wait before the next attempt using exponential backoff
+        with jitter. A Retry-After header on an HTTP 429 response takes precedence.
 
         Args:
-            session (aiohttp.ClientSession): The HTTP session to use for the request.
+            attempt (int): The zero-based index of the attempt that failed.
+            error (ClientError): The error raised by the failed attempt.
+
+        Returns:
+            float: The number of seconds to wait.
+        """
+        if (
+            isinstance(error, ClientResponseError)
+            and error.status == 429
+            and error.headers
+        ):
+            retry_after = error.headers.get("Retry-After")
+            if retry_after and retry_after.isdigit():
+                return float(retry_after)
+        backoff = min(self.max_delay, self.delay * (2**attempt))
+        return backoff + random.uniform(0, 1)
+
+    async def fetch_dataset(self, destination: BinaryIO) -> None:
+        """
+        Fetches the dataset from Kaggle using the downloader's shared session and
+        streams the response body into the destination file in chunks.
+
+        Args:
+            destination (BinaryIO): Seekable binary file the dataset is written to.
 
         Raises:
+            RuntimeError: If the downloader is used outside its context manager.
             Exception: If the dataset cannot be downloaded after the specified retries.
-
-        Returns:
-            bytes: The downloaded dataset content.
         """
+        if self._session is None:
+            raise RuntimeError(
+                "DatasetDownloader must be used as an async context manager."
+            )
         for attempt in range(self.retries):
             try:
-                async with session.get(self.kaggle_api) as response:
+                destination.seek(0)
+                destination.truncate()
+                async with self._session.get(self.kaggle_api) as response:
                     response.raise_for_status()
-                    return await response.read()
+                    async for chunk in response.content.iter_chunked(
+                        CHUNK_SIZE
+                    ):
+                        destination.write(chunk)
+                destination.seek(0)
+                return
             except ClientError as e:
                 self.logger.error(f"Request failed: {e}")
                 if attempt < self.retries - 1:
-                    self.logger.info(f"Retrying in {self.delay} seconds...")
-                    await asyncio.sleep(self.delay)
+                    wait = self._retry_delay(attempt, e)
+                    self.logger.info(f"Retrying in {wait:.1f} seconds...")
+                    await asyncio.sleep(wait)
         self.logger.error(
             f"Failed to download dataset after {self.retries} attempts."
         )
@@ -85,58 +206,57 @@ class DatasetDownloader:
             f"Failed to download dataset after {self.retries} attempts."
         )
 
-    async def download_dataset(self) -> bytes:
+    async def download_dataset(self, destination: BinaryIO) -> None:
         """
-        Downloads the dataset from Kaggle.
+        Downloads the dataset from Kaggle into the destination file.
+
+        Args:
+            destination (BinaryIO): Seekable binary file the dataset is written to.
 
         Raises:
             Exception: If the dataset download fails.
-
-        Returns:
-            bytes: The downloaded dataset content.
         """
-        async with aiohttp.ClientSession(headers=self.headers) as session:
-            self.logger.info(f"Downloading dataset {self.dataset}...")
-            data = await self.fetch_dataset(session)
-            self.logger.info(
-                f"Dataset {self.dataset} downloaded successfully."
-            )
-            return data
+        self.logger.info(f"Downloading dataset {self.dataset}...")
+        await self.fetch_dataset(destination)
+        self.logger.info(f"Dataset {self.dataset} downloaded successfully.")
 
     @staticmethod
-    def extract_files(
-        zip_data: bytes, file_extensions: List[str]
-    ) -> Dict[str, bytes]:
+    def iter_target_files(
+        zip_file: ZipFile, file_extensions: List[str]
+    ) -> Iterator[ZipInfo]:
         """
-        Extracts files with the specified extensions from the ZIP data.
+        Iterates the ZIP central directory once and yields the members with the
+        specified extensions. Nothing is decompressed here.
 
         Args:
-            zip_data (bytes): The ZIP file data.
+            zip_file (ZipFile): The open ZIP archive.
             file_extensions (List[str]): List of file extensions to extract.
 
-        Raises:
-            Exception: If no target files are found in the ZIP archive.
-
-        Returns:
-            Dict[str, bytes]: A dictionary of filenames and their content.
-        """
-        with ZipFile(BytesIO(zip_data)) as zip_file:
-            files = {
-                f: zip_file.read(f)
-                for f in zip_file.namelist()
-                if any(f.endswith(ext) for ext in file_extensions)
-            }
-            if not files:
-                raise Exception("No target files found in the ZIP archive.")
-        return files
+        Yields:
+            ZipInfo: The archive entry of each target file.
+        """
+        extensions = tuple(file_extensions)
+        for info in zip_file.infolist():
+            if not info.is_dir() and info.filename.endswith(extensions):
+                yield info
 
     @staticmethod
-    def load_dataframes(files: Dict[str, bytes]) -> Dict[str, pd.DataFrame]:
+    async def load_dataframes(
+        zip_file: ZipFile, members: List[ZipInfo]
+    ) -> Dict[str, pd.DataFrame]:
         """
-        Loads the extracted files into pandas DataFrames.
+        Loads the given ZIP members into pandas DataFrames.
+
+        CSV files are parsed by PyArrow and Excel files by calamine; both produce
+        Arrow-backed DataFrames. Members smaller than PARSE_IN_PROCESS_MIN_SIZE are
+        streamed straight from the archive into the parser. Larger members are
+        decompressed in a worker thread and parsed in a process pool, so the event
+        loop stays free; at most one large member per pool worker is held in
+        memory at a time.
 
         Args:
-            files (Dict[str, bytes]): Dictionary of filenames and their content.
+            zip_file (ZipFile): The open ZIP archive.
+            members (List[ZipInfo]): The archive entries to load.
 
         Raises:
             Exception: If an error occurs while loading a file into a DataFrame.
@@ -144,36 +264,79 @@ class DatasetDownloader:
         Returns:
             Dict[str, pd.DataFrame]: A dictionary of filenames and their corresponding DataFrames.
         """
-        dataframes = {}
-        logger = LoggerSetup(logger_name="DataFrameLoader").logger
-        for file_name, file_data in files.items():
+        loop = asyncio.get_running_loop()
+        max_workers = os.cpu_count() or 1
+        in_flight = asyncio.Semaphore(max_workers)
+
+        async def load(
+            info: ZipInfo, pool: Optional[ProcessPoolExecutor]
+        ) -> Tuple[str, pd.DataFrame]:
             try:
-                if file_name.endswith(".xlsx"):
-                    dataframes[file_name] = pd.read_excel(BytesIO(file_data))
-                elif file_name.endswith(".csv"):
-                    dataframes[file_name] = pd.read_csv(BytesIO(file_data))
-                logger.info(
-                    f"Loaded file {file_name} with shape: {dataframes[file_name].shape}"
+                if pool is None or info.file_size < PARSE_IN_PROCESS_MIN_SIZE:
+                    with zip_file.open(info) as stream:
+                        result = _parse(info.filename, stream)
+                else:
+                    async with in_flight:
+                        file_data = await loop.run_in_executor(
+                            None, zip_file.read, info
+                        )
+                        result = await loop.run_in_executor(
+                            pool, _parse, info.filename, file_data
+                        )
+                dataframe_logger.info(
+                    f"Loaded file {info.filename} with shape: {result[1].shape}"
                 )
+                return result
             except Exception as e:
-                logger.error(f"Error loading file {file_name}: {e}")
+                dataframe_logger.error(
+                    f"Error loading file {info.filename}: {e}"
+                )
                 raise
-        return dataframes
+
+        use_pool = any(
+            info.file_size >= PARSE_IN_PROCESS_MIN_SIZE for info in members
+        )
+        # Workers are spawned rather than forked: forking inside the running event
+        # loop, while aiohttp's resolver and executor threads are alive, can
+        # deadlock, and the platform default changes across Python versions.
+        pool_context = (
+            ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            if use_pool
+            else nullcontext()
+        )
+        with pool_context as pool:
+            results = await asyncio.gather(
+                *(load(info, pool) for info in members)
+            )
+        return dict(results)
 
     async def run(self) -> Dict[str, pd.DataFrame]:
         """
         Orchestrates the download, extraction, and loading of the dataset into DataFrames.
 
         Raises:
-            Exception: If any step in the process fails.
+            Exception: If no target files are found in the ZIP archive, or if any
+                other step in the process fails.
 
         Returns:
             Dict[str, pd.DataFrame]: A dictionary of filenames and their corresponding DataFrames.
         """
-        zip_data = await self.download_dataset()
-        files = self.extract_files(zip_data, self.file_extensions)
-        dataframes = self.load_dataframes(files)
-        return dataframes
+        with tempfile.SpooledTemporaryFile(
+            max_size=SPOOL_MAX_SIZE
+        ) as zip_data:
+            await self.download_dataset(zip_data)
+            with ZipFile(zip_data) as zip_file:
+                members = list(
+                    self.iter_target_files(zip_file, self.file_extensions)
+                )
+                if not members:
+                    raise Exception(
+                        "No target files found in the ZIP archive."
+                    )
+                return await self.load_dataframes(zip_file, members)
 
 
 async def main(dataset_name: str) -> Dict[str, pd.DataFrame]:
@@ -186,5 +349,5 @@ async def main(dataset_name: str) -> Dict[str, pd.DataFrame]:
     Returns:
         Dict[str, pd.DataFrame]: A dictionary of filenames and their corresponding DataFrames.
     """
-    downloader = DatasetDownloader(dataset_name)
-    return await downloader.run()
+    async with DatasetDownloader(dataset_name) as downloader:
+        return await downloader.run()
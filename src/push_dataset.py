@@ -1,180 +1,264 @@
+import asyncio
 import pandas as pd
 import os
-from typing import Dict
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
-from config import db_config, LoggerSetup
+from io import BytesIO
+from typing import Dict, Iterator, Optional, Tuple
+from pandas.io.sql import get_schema
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from config import LoggerSetup
+from database import AsyncSQLAlchemyConnection, POOL_SIZE
 
+logger = LoggerSetup(logger_name="DataFrameToSQL").logger
 
-class AsyncSQLAlchemyConnection:
+CSV_NULL = r"\N"
+
+
+class DataFrameToSQL:
     """
-    Manages the database connections using SQLAlchemy with asynchronous support.
-    Ensures that connections are properly opened and closed, and transactions are
-    correctly managed with commits or rollbacks as needed.
+    Handles the conversion and insertion of pandas DataFrames into a SQL database.
 
     Attributes:
-        engine (AsyncEngine): The SQLAlchemy engine for asynchronous connections.
-        async_session (sessionmaker): Factory for creating new AsyncSession instances.
+        async_session (async_sessionmaker): Factory for creating new AsyncSession instances.
         logger (logging.Logger): Logger instance for logging messages.
     """
 
-    def __init__(self, db_config: Dict[str, str]):
+    def __init__(
+        self,
+        async_session: async_sessionmaker,
+        max_concurrency: int = POOL_SIZE,
+    ):
         """
-        Initializes the AsyncSQLAlchemyConnection with the provided database configuration.
+        Initializes the DataFrameToSQL with a session factory.
 
         Args:
-            db_config (Dict[str, str]): Dictionary containing database configuration parameters.
-        """
-        self._setup_logger()
-        self._validate_config(db_config)
-        db_url = (
-            f"postgresql+asyncpg://"
-            f"{db_config['user']}:"
-            f"{db_config['password']}"
-            f"@{db_config['host']}:"
-            f"{db_config['port']}/"
-            f"{db_config['database']}"
-        )
-        self.engine = create_async_engine(db_url)
-        self.async_session = sessionmaker(
-            bind=self.engine, class_=AsyncSession, expire_on_commit=False
-        )
-
-    def _setup_logger(self):
-        """Sets up the logger for database operations."""
-        self.logger = LoggerSetup(
-            logger_name="AsyncSQLAlchemyConnection"
-        ).logger
+            async_session (async_sessionmaker): Factory for creating new AsyncSession instances.
+            max_concurrency (int, optional): Maximum number of tables written at once.
+                Should not exceed the connection pool size. Defaults to POOL_SIZE.
+        """
+        self.async_session = async_session
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.logger = logger
 
     @staticmethod
-    def _validate_config(db_config: Dict[str, str]) -> None:
+    def _strip_extension(file_name: str) -> str:
         """
-        Validates the database configuration to ensure all required keys are present.
+        Removes the file extension from a filename.
 
         Args:
-            db_config (Dict[str, str]): Dictionary containing database configuration parameters.
+            file_name (str): The name of the file.
 
-        Raises:
-            ValueError: If any required configuration key is missing.
+        Returns:
+            str: The filename without the extension.
         """
-        required_keys = ["user", "password", "host", "port", "database"]
-        for key in required_keys:
-            if key not in db_config:
-                raise ValueError(
-                    f"Missing required database configuration key: {key}"
-                )
+        return os.path.splitext(file_name)[0]
+
+    @staticmethod
+    def _to_records(df: pd.DataFrame) -> Iterator[Tuple]:
+        """
+        Converts a DataFrame into row tuples that asyncpg can encode. The rows
+        are produced lazily, so COPY consumes them without an extra list copy.
 
+        Columns are boxed into native Python objects and missing values are
+        replaced with None so they are written as SQL NULLs.
 
-class DataFrameToSQL:
-    """
-    Handles the conversion and insertion of pandas DataFrames into a SQL database.
+        Args:
+            df (pd.DataFrame): The DataFrame to convert.
 
-    Attributes:
-        async_session (sessionmaker): Factory for creating new AsyncSession instances.
-        logger (logging.Logger): Logger instance for logging messages.
-    """
+        Returns:
+            Iterator[Tuple]: The DataFrame rows as tuples.
+        """
+        boxed = df.astype(object).where(df.notna(), None)
+        return boxed.itertuples(index=False, name=None)
 
-    def __init__(self, async_session: sessionmaker):
+    @staticmethod
+    def _to_csv_buffer(df: pd.DataFrame) -> BytesIO:
         """
-        Initializes the DataFrameToSQL with a session factory.
+        Serializes a DataFrame into an in-memory CSV buffer without a header.
+        Missing values are written as CSV_NULL so COPY loads them as SQL NULLs.
 
         Args:
-            async_session (sessionmaker): Factory for creating new AsyncSession instances.
+            df (pd.DataFrame): The DataFrame to serialize.
+
+        Returns:
+            BytesIO: The CSV content, positioned at the start.
         """
-        self.async_session = async_session
-        self.logger = LoggerSetup(logger_name="DataFrameToSQL").logger
+        csv_data = df.to_csv(index=False, header=False, na_rep=CSV_NULL)
+        buffer = BytesIO(csv_data.encode("utf-8"))
+        buffer.seek(0)
+        return buffer
 
-    @staticmethod
-    def _strip_extension(file_name: str) -> str:
+    async def _create_table(
+        self, session: AsyncSession, table_name: str, df: pd.DataFrame
+    ):
         """
-        Removes the file extension from a filename.
+        Creates (or replaces) a table from the DataFrame schema without writing rows.
+        The DDL is generated from the DataFrame dtypes and runs in the session's
+        transaction.
 
         Args:
-            file_name (str): The name of the file.
+            session (AsyncSession): The session used to reach the database.
+            table_name (str): The name of the table to create.
+            df (pd.DataFrame): The DataFrame whose schema defines the table.
+        """
 
-        Returns:
-            str: The filename without the extension.
+        def create(sync_session):
+            connection = sync_session.connection()
+            quoted_name = connection.dialect.identifier_preparer.quote(
+                table_name
+            )
+            connection.exec_driver_sql(f"DROP TABLE IF EXISTS {quoted_name}")
+            connection.exec_driver_sql(
+                get_schema(df, table_name, con=connection)
+            )
+
+        await session.run_sync(create)
+
+    async def _copy_rows(
+        self, session: AsyncSession, table_name: str, df: pd.DataFrame
+    ):
         """
-        return os.path.splitext(file_name)[0]
+        Streams the DataFrame rows into an existing table with the PostgreSQL COPY
+        protocol through the raw asyncpg connection. If asyncpg cannot encode a
+        value in binary form (for example a mixed-type object column, or an
+        integer too large for BIGINT), the binary copy is rolled back to a
+        savepoint and the DataFrame is sent as CSV instead, leaving the server to
+        parse the values.
+
+        Args:
+            session (AsyncSession): The session whose connection is used.
+            table_name (str): The name of the target table.
+            df (pd.DataFrame): The DataFrame to insert.
+        """
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver = raw_connection.driver_connection
+        columns = [str(column) for column in df.columns]
+        try:
+            async with driver.transaction():
+                await driver.copy_records_to_table(
+                    table_name,
+                    records=self._to_records(df),
+                    columns=columns,
+                )
+        except (TypeError, ValueError, OverflowError) as e:
+            self.logger.warning(
+                f"Falling back to CSV COPY for table '{table_name}': {e}"
+            )
+            await driver.copy_to_table(
+                table_name,
+                source=self._to_csv_buffer(df),
+                columns=columns,
+                format="csv",
+                null=CSV_NULL,
+            )
 
-    async def create_tables(self, dataframes: Dict[str, pd.DataFrame]):
+    async def _load_one(
+        self, session: AsyncSession, file_name: str, df: pd.DataFrame
+    ):
         """
-        Creates database tables based on the provided DataFrames.
+        Creates the table for a single DataFrame and copies its rows within the
+        given session. Empty DataFrames only get their table created. Committing or
+        rolling back is left to the caller.
 
         Args:
-            dataframes (Dict[str, pd.DataFrame]): Dictionary of filenames and their corresponding DataFrames.
+            session (AsyncSession): The session, with an open transaction, to write with.
+            file_name (str): The name of the source file, used as the table name.
+            df (pd.DataFrame): The DataFrame to write.
 
         Raises:
-            Exception: If an error occurs during table creation.
+            Exception: If an error occurs while creating or filling the table.
         """
-        async with self.async_session() as session:
-            for file_name, df in dataframes.items():
-                table_name = self._strip_extension(file_name)
-                self.logger.info(f"Creating table for DataFrame: {table_name}")
-                try:
-                    await session.run_sync(
-                        lambda sync_session: df.to_sql(
-                            table_name,
-                            con=sync_session.bind,
-                            index=False,
-                            if_exists="replace",
-                        )
-                    )
-                    self.logger.info(
-                        f"Table '{table_name}' created successfully based on DataFrame schema."
-                    )
-                except Exception as e:
-                    self.logger.error(
-                        f"Error creating table '{table_name}': {e}",
-                        exc_info=True,
-                    )
-                    raise
-
-    async def insert_data(self, dataframes: Dict[str, pd.DataFrame]):
-        """
-        Inserts data into existing database tables from the provided DataFrames.
+        table_name = self._strip_extension(file_name)
+        self.logger.info(f"Loading DataFrame into table: {table_name}")
+        try:
+            await self._create_table(session, table_name, df)
+            if df.empty:
+                self.logger.info(
+                    f"DataFrame for table '{table_name}' is empty; skipping row copy."
+                )
+            else:
+                await self._copy_rows(session, table_name, df)
+            self.logger.info(
+                f"Table '{table_name}' created and loaded successfully."
+            )
+        except Exception as e:
+            self.logger.error(
+                f"Error loading table '{table_name}': {e}",
+                exc_info=True,
+            )
+            raise
+
+    async def _load_one_in_own_session(self, file_name: str, df: pd.DataFrame):
+        """
+        Loads a single DataFrame in a session and transaction of its own, so a
+        failed load leaves no partial table behind.
+
+        Args:
+            file_name (str): The name of the source file, used as the table name.
+            df (pd.DataFrame): The DataFrame to write.
+        """
+        async with self._semaphore, self.async_session() as session:
+            async with session.begin():
+                await self._load_one(session, file_name, df)
+
+    async def load_tables(
+        self,
+        dataframes: Dict[str, pd.DataFrame],
+        session: Optional[AsyncSession] = None,
+    ):
+        """
+        Creates a table for each provided DataFrame and loads its rows.
+
+        When a session is given, the tables are loaded one after another inside its
+        transaction, so the whole load commits or rolls back together. Otherwise
+        each DataFrame is written concurrently in its own session; if one load
+        fails, the others are cancelled and awaited before the error is raised.
 
         Args:
             dataframes (Dict[str, pd.DataFrame]): Dictionary of filenames and their corresponding DataFrames.
+            session (Optional[AsyncSession], optional): Session with an open transaction
+                to load every table in. Defaults to None.
 
         Raises:
-            Exception: If an error occurs during data insertion.
+            Exception: If an error occurs while loading any table.
+            ExceptionGroup: If loading concurrently and one or more tables fail.
         """
-        async with self.async_session() as session:
+        if session is not None:
+            for file_name, df in dataframes.items():
+                await self._load_one(session, file_name, df)
+            return
+
+        async with asyncio.TaskGroup() as task_group:
             for file_name, df in dataframes.items():
-                table_name = self._strip_extension(file_name)
-                self.logger.info(f"Inserting data into table: {table_name}")
-                try:
-                    await session.run_sync(
-                        lambda sync_session: df.to_sql(
-                            table_name,
-                            con=sync_session.bind,
-                            index=False,
-                            if_exists="append",
-                        )
-                    )
-                    self.logger.info(
-                        f"Data inserted into table '{table_name}' successfully."
-                    )
-                except Exception as e:
-                    self.logger.error(
-                        f"Error inserting data into table '{table_name}': {e}",
-                        exc_info=True,
-                    )
-                    raise
-
-
-async def push_dataset(dataframes: Dict[str, pd.DataFrame]):
+                task_group.create_task(
+                    self._load_one_in_own_session(file_name, df)
+                )
+
+
+async def push_dataset(
+    dataframes: Dict[str, pd.DataFrame], atomic: bool = True
+):
     """
-    Pushes the dataset into the database by creating tables and inserting data.
+    Pushes the dataset into the database by creating and loading one table per
+    DataFrame.
 
     Args:
         dataframes (Dict[str, pd.DataFrame]): Dictionary of filenames and their corresponding DataFrames.
+        atomic (bool, optional): If True, every table is loaded in a single
+            transaction, so a failure leaves the database unchanged. If False,
+            tables are loaded concurrently, each in its own transaction, using at
+            most as many connections as the engine's pool holds. Defaults to True.
 
     Raises:
         Exception: If any step in the process fails.
     """
-    connection = AsyncSQLAlchemyConnection(db_config)
-    df_to_sql = DataFrameToSQL(connection.async_session)
-    await df_to_sql.create_tables(dataframes)
-    await df_to_sql.insert_data(dataframes)
+    connection = AsyncSQLAlchemyConnection()
+    df_to_sql = DataFrameToSQL(
+        connection.async_session, max_concurrency=connection.engine.pool.size()
+    )
+    if not atomic:
+        await df_to_sql.load_tables(dataframes)
+        return
+
+    async with connection.async_session() as session, session.begin():
+        await df_to_sql.load_tables(dataframes, session)